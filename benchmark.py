@@ -0,0 +1,220 @@
+"""Comparacion de estrategias de resolucion
+https://github.com/pablosambuco/pysudoku
+"""
+
+# pylint: disable=redefined-builtin
+import time
+import tracemalloc
+from rich import print
+from rich.table import Table
+from sudoku import (
+    Tablero,
+    EstrategiaMRV,
+    EstrategiaGrado,
+    EstrategiaMenosRestrictiva,
+    EstrategiaAleatoria,
+    EstrategiaIndexada,
+)
+
+REPETICIONES = 5
+RUIDO = 0.10  # diferencia relativa de tiempo que se considera empate
+CANTIDAD = 500  # tableros vivos para medir memoria
+
+TABLEROS = {
+    "Basico": [
+        [0, 0, 0, 0, 5, 0, 0, 0, 9],
+        [0, 0, 0, 3, 0, 0, 8, 4, 0],
+        [4, 3, 0, 1, 8, 7, 0, 6, 0],
+        [3, 0, 8, 0, 0, 0, 0, 7, 0],
+        [0, 0, 0, 4, 3, 2, 0, 0, 0],
+        [0, 5, 0, 0, 0, 0, 9, 0, 2],
+        [0, 4, 0, 2, 1, 0, 0, 9, 8],
+        [0, 9, 3, 0, 0, 8, 0, 0, 0],
+        [7, 0, 0, 0, 9, 0, 0, 0, 0],
+    ],
+    "Intermedio": [
+        [0, 4, 3, 0, 2, 0, 8, 0, 0],
+        [7, 9, 0, 0, 5, 4, 0, 0, 0],
+        [0, 0, 0, 0, 0, 0, 0, 0, 9],
+        [0, 0, 0, 6, 0, 0, 9, 0, 7],
+        [0, 0, 0, 5, 0, 8, 0, 0, 0],
+        [1, 0, 7, 0, 0, 2, 0, 0, 0],
+        [3, 0, 0, 0, 0, 0, 0, 0, 0],
+        [0, 0, 0, 4, 6, 0, 0, 9, 1],
+        [0, 0, 5, 0, 8, 0, 7, 2, 0],
+    ],
+    "Avanzado": [
+        [1, 0, 0, 9, 4, 0, 3, 0, 0],
+        [0, 0, 0, 0, 0, 8, 1, 0, 6],
+        [9, 0, 0, 0, 0, 0, 0, 2, 0],
+        [0, 7, 0, 1, 0, 4, 0, 0, 9],
+        [6, 0, 4, 0, 9, 0, 7, 0, 1],
+        [3, 0, 0, 6, 0, 7, 0, 4, 0],
+        [0, 9, 0, 0, 0, 0, 0, 0, 4],
+        [2, 0, 1, 4, 0, 0, 0, 0, 0],
+        [0, 0, 3, 0, 7, 6, 0, 0, 8],
+    ],
+    "websudoku evil": [
+        [0, 9, 0, 0, 4, 6, 0, 0, 3],
+        [0, 8, 0, 0, 7, 0, 0, 0, 0],
+        [1, 0, 0, 0, 0, 0, 2, 0, 0],
+        [0, 0, 1, 0, 0, 7, 0, 0, 5],
+        [0, 0, 3, 0, 2, 0, 6, 0, 0],
+        [7, 0, 0, 9, 0, 0, 1, 0, 0],
+        [0, 0, 9, 0, 0, 0, 0, 0, 4],
+        [0, 0, 0, 0, 3, 0, 0, 2, 0],
+        [2, 0, 0, 5, 8, 0, 0, 7, 0],
+    ],
+    "scargot": [
+        [1, 0, 0, 0, 0, 7, 0, 9, 0],
+        [0, 3, 0, 0, 2, 0, 0, 0, 8],
+        [0, 0, 9, 6, 0, 0, 5, 0, 0],
+        [0, 0, 5, 3, 0, 0, 9, 0, 0],
+        [0, 1, 0, 0, 8, 0, 0, 0, 2],
+        [6, 0, 0, 0, 0, 4, 0, 0, 0],
+        [3, 0, 0, 0, 0, 0, 0, 1, 0],
+        [0, 4, 0, 0, 0, 0, 0, 0, 7],
+        [0, 0, 7, 0, 0, 0, 3, 0, 0],
+    ],
+    "Imposible": [
+        [0, 0, 0, 4, 0, 3, 8, 0, 0],
+        [5, 0, 0, 0, 9, 0, 0, 0, 0],
+        [0, 8, 6, 0, 0, 0, 0, 0, 7],
+        [0, 0, 5, 2, 0, 0, 0, 8, 4],
+        [0, 2, 1, 0, 0, 0, 0, 5, 0],
+        [0, 0, 0, 0, 0, 0, 7, 0, 9],
+        [1, 5, 0, 7, 0, 0, 9, 0, 8],
+        [4, 9, 0, 0, 1, 0, 2, 0, 0],
+        [0, 0, 0, 0, 0, 0, 0, 7, 1],
+    ],
+}
+
+ESTRATEGIAS = {
+    "MRV": EstrategiaMRV,
+    "Grado": EstrategiaGrado,
+    "Menos restrictiva": EstrategiaMenosRestrictiva,
+    "Aleatoria": lambda: EstrategiaAleatoria(semilla=0),
+    "Indexada": EstrategiaIndexada,
+}
+
+
+def medir(carga, fabrica):
+    """Funcion para medir la resolucion de un tablero con una estrategia
+
+    Args:
+        carga (list): lista de N listas de N enteros que forman el sudoku
+        fabrica (callable): constructor de la estrategia
+
+    Los nodos y el resultado se toman de la primera corrida; el tiempo es
+    el mejor de REPETICIONES corridas
+
+    Returns:
+        tuple: (mejor tiempo en segundos, nodos, resuelto)
+    """
+    mejor = None
+    nodos = None
+    resuelto = None
+    for _ in range(REPETICIONES):
+        estrategia = fabrica()
+        tab = Tablero()
+        tab.cargar(carga)
+        inicio = time.perf_counter()
+        tab.resolver(estrategia=estrategia)
+        tiempo = time.perf_counter() - inicio
+        if mejor is None or tiempo < mejor:
+            mejor = tiempo
+        if nodos is None:
+            nodos = estrategia.nodos
+            resuelto = tab.verificar()
+    return mejor, nodos, resuelto
+
+
+def ganadora(medidas):
+    """Funcion para elegir la mejor estrategia de un tablero
+
+    Las estrategias cuyo tiempo esta a menos de RUIDO del mejor se
+    consideran empatadas, y entre ellas se prefiere la de menos nodos
+
+    Args:
+        medidas (dict): nombre -> (tiempo, nodos, resuelto)
+
+    Returns:
+        string: nombre de la ganadora, o "empate" con las empatadas
+    """
+    resueltas = {k: v for k, v in medidas.items() if v[2]}
+    if not resueltas:
+        return "[red]-[/red]"
+    mejor = min(tiempo for tiempo, _, _ in resueltas.values())
+    empatadas = {
+        k: v for k, v in resueltas.items() if v[0] <= mejor * (1 + RUIDO)
+    }
+    min_nodos = min(nodos for _, nodos, _ in empatadas.values())
+    nombres = [k for k, v in empatadas.items() if v[1] == min_nodos]
+    if len(nombres) == 1:
+        return nombres[0]
+    return "empate: " + ", ".join(nombres)
+
+
+def memoria(carga):
+    """Funcion para medir la memoria de tableros vivos con tracemalloc
+
+    Args:
+        carga (list): lista de N listas de N enteros que forman el sudoku
+
+    Returns:
+        tuple: (bytes por tablero cargado, bytes por copia del resuelto)
+    """
+    resuelto = Tablero()
+    resuelto.cargar(carga)
+    resuelto.resolver()
+
+    tableros = []
+    tracemalloc.start()
+    for _ in range(CANTIDAD):
+        tab = Tablero()
+        tab.cargar(carga)
+        tableros.append(tab)
+    cargado = tracemalloc.get_traced_memory()[0] / CANTIDAD
+    tracemalloc.stop()
+
+    tableros = []
+    tracemalloc.start()
+    for _ in range(CANTIDAD):
+        tableros.append(resuelto.copiar())
+    copia = tracemalloc.get_traced_memory()[0] / CANTIDAD
+    tracemalloc.stop()
+    return cargado, copia
+
+
+def main():
+    """main"""
+    table = Table(title="Estrategias (mejor tiempo en ms / nodos)")
+    table.add_column("Tablero")
+    for nombre in ESTRATEGIAS:
+        table.add_column(nombre, justify="right")
+    table.add_column("Ganadora")
+
+    for tablero, carga in TABLEROS.items():
+        medidas = {}
+        fila = []
+        for nombre, fabrica in ESTRATEGIAS.items():
+            tiempo, nodos, resuelto = medir(carga, fabrica)
+            medidas[nombre] = (tiempo, nodos, resuelto)
+            celda = f"{tiempo * 1000:.1f} / {nodos}"
+            fila.append(celda if resuelto else f"[red]{celda}[/red]")
+        table.add_row(tablero, *fila, ganadora(medidas))
+
+    print(table)
+
+    table = Table(title=f"Memoria por tablero ({CANTIDAD} tableros vivos)")
+    table.add_column("Tablero")
+    table.add_column("Cargado", justify="right")
+    table.add_column("Copia resuelto", justify="right")
+    for tablero, carga in TABLEROS.items():
+        cargado, copia = memoria(carga)
+        table.add_row(tablero, f"{cargado:,.0f} B", f"{copia:,.0f} B")
+    print(table)
+
+
+if __name__ == "__main__":
+    main()